@@ -1,13 +1,16 @@
 import csv
+import numpy as np
 import pandas as pd
-from collections import defaultdict
+from collections import Counter
 import webbrowser
 import os
-from urllib.parse import urlparse
 import sys
 import json
 import re
 from email.utils import parsedate_to_datetime
+from functools import lru_cache, partial
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 import html
 
 # --- Default Headers for Logger++ CSV when header is missing ---
@@ -15,33 +18,127 @@ DEFAULT_HEADERS = [
     'Entry.Tool','Entry.Tags','Entry.InScope','Entry.ListenInterface','Entry.ClientIP','Request.AsBase64','Request.Headers','Request.Body','Request.BodyLength','Request.Time','Request.Length','Request.Tool','Request.Comment','Request.Complete','Request.URL','Request.Method','Request.Path','Request.Query','Request.PathQuery','Request.Protocol','Request.IsSSL','Request.UsesCookieJar','Request.Hostname','Request.Host','Request.Port','Request.ContentType','Request.RequestHttpVersion','Request.Extension','Request.Referrer','Request.HasParams','Request.HasGetParam','Request.HasPostParam','Request.HasSentCookies','Request.CookieString','Request.ParameterCount','Request.Parameters','Request.Origin','Response.AsBase64','Response.Headers','Response.Body','Response.BodyLength','Response.hash','Response.Time','Response.Length','Response.Redirect','Response.Status','Response.StatusText','Response.ResponseHttpVersion','Response.RTT','Response.Title','Response.ContentType','Response.InferredType','Response.MimeType','Response.HasSetCookies','Response.Cookies','Response.ReflectedParams','Response.Reflections'
 ]
 
+# --- Upper bound on worker processes loading a folder of CSV files ---
+MAX_LOAD_WORKERS = 8
+
+# --- Endpoints rendered per chunk when streaming the HTML report ---
+REPORT_BATCH_SIZE = 10_000
+
+# --- Only columns the analysis reads; the rest of the export is never parsed ---
+USED_COLS = ['Request.URL', 'Request.Tool', 'Request.Time', 'Response.Headers']
+
+# --- Rows per chunk when reading CSV files ---
+CHUNK_SIZE = 200_000
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = pc = None
+
+# --- Keep parsed columns Arrow-backed when pyarrow is installed and pandas (>= 2.0) supports it.
+# Parsing stays on the C engine: pyarrow's own reader loses sync on the CR/LF inside quoted
+# Request/Response cells ---
+READ_CSV_OPTIONS = {'low_memory': False, 'chunksize': CHUNK_SIZE}
+if pa is not None and int(pd.__version__.split('.')[0]) >= 2:
+    READ_CSV_OPTIONS['dtype_backend'] = 'pyarrow'
+
+# --- Logger++ 'Request.Time' format, e.g. 07/22/2025 10:00:00 AM ---
+REQUEST_TIME_FORMAT = '%m/%d/%Y %I:%M:%S %p'
+
+# --- Hostname of a Request.URL: scheme://[userinfo@]host[:port]... ---
+HOST_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9+.-]*://(?:[^/?#@]*@)?(\[[^\]/?#]*\]|[^/?#:]+)')
+
+# --- Value of the 'Date:' line in raw response headers, and its usual (IMF-fixdate) format ---
+DATE_HEADER_PATTERN = r'(?im)^Date:\s*(?P<date>.*?)\s*$'
+DATE_HEADER_RE = re.compile(DATE_HEADER_PATTERN)
+HTTP_DATE_FORMAT = '%a, %d %b %Y %H:%M:%S GMT'
+
 def has_header(file_path):
     """
     Checks if the CSV file likely contains a header row.
     """
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            first_line = f.readline()
-            return 'Entry.Tool' in first_line and 'Request.URL' in first_line
+        # Both markers are ASCII, so the first line is checked as raw bytes without decoding
+        with open(file_path, 'rb', buffering=65536) as f:
+            first_line = f.readline(4096)
+            return b'Entry.Tool' in first_line and b'Request.URL' in first_line
     except Exception:
         return False
 
-def load_csv_safely(file_path):
+def read_csv_chunks(file_path, **kwargs):
+    """
+    Yields the CSV file in chunks of CHUNK_SIZE rows.
+    """
+    with pd.read_csv(file_path, **kwargs, **READ_CSV_OPTIONS) as reader:
+        yield from reader
+
+def filter_requests(df, exclude_extensions=None, exclude_tools=None):
+    """
+    Drops requests without a URL and requests for the excluded file extensions and Burp tools.
+    """
+    if 'Request.URL' in df.columns:
+        df = df.dropna(subset=['Request.URL'])
+
+    if exclude_extensions and 'Request.URL' in df.columns:
+        # One case-insensitive alternation; the extension may be followed by a query or fragment
+        pattern = r'\.(?:' + '|'.join(re.escape(ext) for ext in exclude_extensions) + r')(?:[?#]|$)'
+        df = df[~df['Request.URL'].str.contains(pattern, case=False, na=False, regex=True)]
+
+    if exclude_tools and 'Request.Tool' in df.columns:
+        df = df[~df['Request.Tool'].isin(exclude_tools)]
+
+    return df
+
+def load_csv_safely(file_path, exclude_extensions=None, exclude_tools=None):
     """
     Safely loads a CSV file into a pandas DataFrame, handling potential commas in fields
-    and automatically detecting if a header is present.
+    and automatically detecting if a header is present. Filters are applied chunk by chunk
+    so excluded rows are never held in memory all at once.
     """
     try:
+        # A callable, so exports missing one of USED_COLS (e.g. Request.Time) still load
+        usecols = lambda col: col in USED_COLS
         if has_header(file_path):
-            df = pd.read_csv(file_path, low_memory=False, on_bad_lines='warn')
+            chunks = read_csv_chunks(file_path, usecols=usecols, on_bad_lines='warn')
         else:
             print(f"Warning: No header found in {os.path.basename(file_path)}. Applying default headers.")
-            df = pd.read_csv(file_path, header=None, names=DEFAULT_HEADERS, low_memory=False, on_bad_lines='warn')
-        return df
+            chunks = read_csv_chunks(file_path, header=None, names=DEFAULT_HEADERS, usecols=usecols, on_bad_lines='warn')
+
+        kept = []
+        for chunk in chunks:
+            chunk = filter_requests(chunk, exclude_extensions, exclude_tools)
+            if not chunk.empty:
+                kept.append(chunk)
+        return pd.concat(kept, ignore_index=True) if kept else pd.DataFrame()
     except Exception as e:
         print(f"Error reading CSV file {file_path}: {e}")
         return pd.DataFrame()
 
+@lru_cache(maxsize=4096)
+def _parsedate(date_str):
+    """
+    Parses an HTTP date string, caching results since responses sent in the same second share one.
+    """
+    try:
+        return parsedate_to_datetime(date_str)
+    except (TypeError, ValueError):
+        return None
+
+def parse_request_times(times):
+    """
+    Parses 'Request.Time' values into datetimes, with NaT for anything unparseable.
+    Uses pyarrow's vectorized strptime when available.
+    """
+    if pa is not None:
+        try:
+            parsed = pc.strptime(pa.array(times), format=REQUEST_TIME_FORMAT, unit='ns', error_is_null=True)
+            return parsed.to_pandas().set_axis(times.index)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+            pass  # e.g. a column of all-empty values read as floats
+    # Timestamps repeat at one-second resolution, so caching unique values pays off
+    return pd.to_datetime(times, format=REQUEST_TIME_FORMAT, errors='coerce', cache=True)
+
 def extract_date_from_headers(headers_str):
     """
     Extracts the date from the 'Date:' line in raw HTTP headers.
@@ -49,55 +146,104 @@ def extract_date_from_headers(headers_str):
     if not isinstance(headers_str, str):
         return None
     
-    match = re.search(r'^Date:\s*(.*)', headers_str, re.IGNORECASE | re.MULTILINE)
+    match = DATE_HEADER_RE.search(headers_str)
     if match:
-        date_str = match.group(1).strip()
-        try:
-            return parsedate_to_datetime(date_str)
-        except (TypeError, ValueError):
-            return None
+        return _parsedate(match.group('date'))
     return None
 
+def count_pairs(rows, cols):
+    """
+    Counts how often each (rows, cols) value pair occurs, as a DataFrame indexed by the
+    values of rows with one column per value of cols. Pairs that never occur are zero.
+    """
+    rows, cols = rows.astype('category'), cols.astype('category')
+    row_cats, col_cats = rows.cat.categories, cols.cat.categories
+    row_codes, col_codes = rows.cat.codes.to_numpy(), cols.cat.codes.to_numpy()
+
+    # Code -1 marks a missing value; flatten each remaining pair into one bin index
+    present = (row_codes >= 0) & (col_codes >= 0)
+    pair_codes = row_codes[present].astype(np.int64) * len(col_cats) + col_codes[present]
+    matrix = np.bincount(pair_codes, minlength=len(row_cats) * len(col_cats)).reshape(len(row_cats), len(col_cats))
+
+    counts = pd.DataFrame(matrix, index=pd.Index(row_cats, name=rows.name), columns=pd.Index(col_cats, name=cols.name))
+    return counts.loc[counts.any(axis=1), counts.any(axis=0)]
+
+def escape_html_series(values):
+    """
+    Vectorized equivalent of html.escape() for a whole Series of strings.
+    """
+    return (values.astype(str)
+            .str.replace('&', '&amp;', regex=False)  # first, so the entities below are not re-escaped
+            .str.replace('<', '&lt;', regex=False)
+            .str.replace('>', '&gt;', regex=False)
+            .str.replace('"', '&quot;', regex=False)
+            .str.replace("'", '&#x27;', regex=False))
+
+def nonzero_pairs(counts):
+    """
+    Converts a count_pairs() matrix into {row: {column: count}}, keeping only the pairs that occurred.
+    """
+    columns = counts.columns.tolist()
+    return {
+        row: {col: int(count) for col, count in zip(columns, values) if count}
+        for row, values in zip(counts.index, counts.to_numpy())
+    }
+
+def render_endpoint_rows(endpoint_counts):
+    """
+    Yields the HTML rows of the endpoints table, REPORT_BATCH_SIZE endpoints at a time.
+    """
+    for start in range(0, len(endpoint_counts), REPORT_BATCH_SIZE):
+        batch = endpoint_counts.iloc[start:start + REPORT_BATCH_SIZE].rename_axis('url').reset_index(name='count')
+        rows = '<tr><td>' + escape_html_series(batch['url']) + '</td><td>' + batch['count'].astype(str) + '</td></tr>'
+        yield ''.join(rows.tolist())
+
 def analyze_burp_log(df, exclude_extensions=None, exclude_tools=None):
     """
     Analyzes a DataFrame of Burp Suite Logger++ data to provide insights on web security testing activity.
+    The HTML report is returned as an iterator of string chunks so it can be written out without
+    holding the whole document in memory.
     """
     if df.empty:
         print("The initial data is empty. No analysis to perform.")
         return None, None
     
-    # --- Apply Filters ---
+    required_columns = ['Request.URL', 'Request.Tool']
+    for col in required_columns:
+        if col not in df.columns:
+            print(f"Error: Required column '{col}' not found. The CSV might be malformed or not from Logger++.")
+            return None, None
+
+    # --- Apply Filters (before timestamp parsing, so dropped rows are never parsed) ---
+    df = filter_requests(df, exclude_extensions, exclude_tools)
     if exclude_extensions:
-        extensions_tuple = tuple(f".{ext.lower()}" for ext in exclude_extensions)
-        df = df[~df['Request.URL'].str.lower().str.endswith(extensions_tuple, na=False)]
         print(f"Filtered out requests with extensions: {', '.join(exclude_extensions)}")
 
     if exclude_tools:
-        df = df[~df['Request.Tool'].isin(exclude_tools)]
         print(f"Filtered out requests from tools: {', '.join(exclude_tools)}")
 
     if df.empty:
         print("All data was filtered out. No analysis to perform.")
         return None, None
-        
-    required_columns = ['Request.URL', 'Request.Tool']
-    for col in required_columns:
-        if col not in df.columns:
-            print(f"Error: Required column '{col}' not found. The CSV might be malformed or not from Logger++.")
-            return None, None
 
     # --- Timestamp Parsing Logic ---
     if 'Request.Time' in df.columns:
-        df['Time'] = pd.to_datetime(df['Request.Time'], format='%m/%d/%Y %I:%M:%S %p', errors='coerce')
+        df['Time'] = parse_request_times(df['Request.Time'])
     else:
         df['Time'] = pd.NaT
 
     if df['Time'].isnull().all():
         print("Warning: Could not parse 'Request.Time'. Falling back to 'Response.Headers' for timestamps.")
         if 'Response.Headers' in df.columns:
-            df['Time'] = df['Response.Headers'].apply(extract_date_from_headers)
-            if 'Time' in df.columns and df['Time'].notna().any():
-                 df['Time'] = df['Time'].dt.tz_localize(None)
+            # An export without responses reads this column as all-missing floats, which have no .str
+            headers = df['Response.Headers'].astype('string')
+            date_strs = headers.str.extract(DATE_HEADER_PATTERN, expand=False)
+            times = pd.to_datetime(date_strs, format=HTTP_DATE_FORMAT, errors='coerce', utc=True)
+            # Obsolete date formats and numeric offsets go through the per-row parser
+            leftover = times.isna() & date_strs.notna()
+            if leftover.any():
+                times[leftover] = pd.to_datetime(headers[leftover].apply(extract_date_from_headers), errors='coerce', utc=True)
+            df['Time'] = times.dt.tz_localize(None)
         else:
             print("Error: 'Response.Headers' column not found. Cannot determine request times.")
             return None, None
@@ -108,34 +254,43 @@ def analyze_burp_log(df, exclude_extensions=None, exclude_tools=None):
         print("Error: No valid timestamps could be determined from 'Request.Time' or 'Response.Headers'.")
         return None, None
 
+    # Repeated strings as categoricals so counting hashes integer codes, not URLs
+    for col in ('Request.Tool', 'Request.URL'):
+        df[col] = df[col].astype('category')
+
     # --- Analysis ---
     min_date, max_date = df['Time'].min(), df['Time'].max()
     date_range_str = f"{min_date.strftime('%d/%m/%Y %H:%M:%S')} to {max_date.strftime('%d/%m/%Y %H:%M:%S')}"
 
-    df['Target'] = df['Request.URL'].apply(lambda x: urlparse(x).hostname if isinstance(x, str) else None)
+    df['Target'] = df['Request.URL'].str.extract(HOST_RE, expand=False).str.strip('[]').str.lower().astype('category')
     
-    endpoint_counts = df['Request.URL'].value_counts().to_dict()
-    target_counts = df['Target'].value_counts().to_dict()
+    # value_counts() is already sorted by count, descending
+    endpoint_counts = df['Request.URL'].value_counts()
+    target_counts = df['Target'].value_counts()
 
-    tool_endpoint_counts = defaultdict(lambda: defaultdict(int))
-    for _, row in df.iterrows():
-        tool_endpoint_counts[row['Request.URL']][row['Request.Tool']] += 1
+    tool_endpoint_counts = count_pairs(df['Request.URL'], df['Request.Tool'])
 
     df['Date'] = df['Time'].dt.date
-    daily_summary = defaultdict(lambda: {'total': 0, 'tools': defaultdict(int)})
-    for _, row in df.iterrows():
-        date_str = row['Date'].strftime('%Y-%m-%d')
-        daily_summary[date_str]['total'] += 1
-        daily_summary[date_str]['tools'][row['Request.Tool']] += 1
+    daily = count_pairs(df['Date'], df['Request.Tool'])
+    daily_counts = daily.to_numpy()
+    tools = daily.columns.tolist()
+    daily_summary = {
+        date.strftime('%Y-%m-%d'): {
+            'total': int(counts.sum()),
+            'tools': Counter({tool: int(count) for tool, count in zip(tools, counts) if count})
+        }
+        for date, counts in zip(daily.index, daily_counts)
+    }
         
-    tool_summary = df['Request.Tool'].value_counts().to_dict()
+    tool_summary = df['Request.Tool'].value_counts()
 
     # --- Productivity Analysis ---
     total_requests = len(df)
-    active_days = df['Date'].nunique()
+    date_counts = df['Date'].value_counts()  # sorted descending, so the peak day comes first
+    active_days = date_counts.size
     avg_req_per_day = total_requests / active_days if active_days > 0 else 0
-    peak_day = df['Date'].value_counts().idxmax().strftime('%d/%m/%Y') if not df.empty and not df['Date'].value_counts().empty else "N/A"
-    peak_day_count = df['Date'].value_counts().max() if not df.empty and not df['Date'].value_counts().empty else 0
+    peak_day = date_counts.index[0].strftime('%d/%m/%Y') if not date_counts.empty else "N/A"
+    peak_day_count = int(date_counts.iat[0]) if not date_counts.empty else 0
     
     productivity_metrics = {
         "Total Requests": total_requests,
@@ -153,11 +308,11 @@ def analyze_burp_log(df, exclude_extensions=None, exclude_tools=None):
         print(f"- {key}: {value}")
     
     print(f"\nTotal Requests per Target URL:")
-    for target, count in sorted(target_counts.items(), key=lambda item: item[1], reverse=True):
+    for target, count in target_counts.items():
         print(f"- {target}: {count}")
 
     print(f"\nTop 10 Endpoints by Request Count:")
-    for endpoint, count in sorted(endpoint_counts.items(), key=lambda item: item[1], reverse=True)[:10]:
+    for endpoint, count in endpoint_counts.head(10).items():
         print(f"- {endpoint}: {count}")
 
     # --- HTML Report Generation ---
@@ -165,13 +320,10 @@ def analyze_burp_log(df, exclude_extensions=None, exclude_tools=None):
     daily_chart_labels = json.dumps([item[0] for item in sorted_daily_summary])
     daily_chart_data = json.dumps([item[1]['total'] for item in sorted_daily_summary])
     
-    sorted_endpoints = sorted(endpoint_counts.items(), key=lambda item: item[1], reverse=True)
-    
-    escaped_endpoints_html = ''.join([f"<tr><td>{html.escape(str(endpoint))}</td><td>{count}</td></tr>" for endpoint, count in sorted_endpoints])
     escaped_daily_summary_html = ''.join([f"<tr><td>{pd.to_datetime(d).strftime('%d/%m/%Y')}</td><td>{v['total']}</td><td>{'<br>'.join([f'{html.escape(t)}: {c}' for t, c in v['tools'].items()])}</td></tr>" for d, v in sorted_daily_summary])
 
 
-    html_content = f"""
+    html_head = f"""
     <html>
     <head>
         <title>Burp Suite Analysis Report</title>
@@ -213,7 +365,7 @@ def analyze_burp_log(df, exclude_extensions=None, exclude_tools=None):
                     <div>
                         <table>
                             <tr><th>Tool</th><th>Total Requests</th></tr>
-                            {''.join([f"<tr><td>{html.escape(tool)}</td><td>{count}</td></tr>" for tool, count in sorted(tool_summary.items(), key=lambda item: item[1], reverse=True)])}
+                            {''.join([f"<tr><td>{html.escape(tool)}</td><td>{count}</td></tr>" for tool, count in tool_summary.items()])}
                         </table>
                     </div>
                     <div><canvas id="toolChart"></canvas></div>
@@ -226,7 +378,8 @@ def analyze_burp_log(df, exclude_extensions=None, exclude_tools=None):
                 <div class="table-container">
                     <table id="endpointsTable">
                         <tr><th style="width: 85%;">Endpoint</th><th style="width: 15%;">Request Count</th></tr>
-                        {escaped_endpoints_html}
+                        """
+    html_tail = f"""
                     </table>
                 </div>
             </div>
@@ -280,14 +433,16 @@ def analyze_burp_log(df, exclude_extensions=None, exclude_tools=None):
     """
     
     analysis_data = {
-        "endpoint_counts": endpoint_counts,
-        "tool_endpoint_counts": tool_endpoint_counts,
+        "endpoint_counts": endpoint_counts.to_dict(),
+        "tool_endpoint_counts": nonzero_pairs(tool_endpoint_counts),
         "daily_summary": daily_summary,
-        "tool_summary": tool_summary,
-        "target_counts": target_counts,
+        "tool_summary": tool_summary.to_dict(),
+        "target_counts": target_counts.to_dict(),
         "productivity_metrics": productivity_metrics
     }
     
+    html_content = chain([html_head], render_endpoint_rows(endpoint_counts), [html_tail])
+
     return html_content, analysis_data
 
 def main():
@@ -320,31 +475,40 @@ def main():
             return
         
         print(f"Found {len(csv_files)} CSV files. Processing...")
-        for filename in csv_files:
-            file_path = os.path.join(path_input, filename)
-            df = load_csv_safely(file_path)
-            if not df.empty:
-                all_dfs.append(df)
-                print(f" - Successfully loaded {filename}")
+        file_paths = [os.path.join(path_input, filename) for filename in csv_files]
+        load = partial(load_csv_safely, exclude_extensions=exclude_extensions, exclude_tools=exclude_tools)
+        # Parsing holds the GIL while building Python objects, so files are loaded in separate processes
+        with ProcessPoolExecutor(max_workers=min(MAX_LOAD_WORKERS, len(file_paths))) as executor:
+            for filename, df in zip(csv_files, executor.map(load, file_paths)):
+                if not df.empty:
+                    all_dfs.append(df)
+                    print(f" - Successfully loaded {filename}")
         
     elif os.path.isfile(path_input):
         if not path_input.lower().endswith('.csv'):
             print("Error: The provided file is not a CSV file.")
             return
-        df = load_csv_safely(path_input)
+        df = load_csv_safely(path_input, exclude_extensions, exclude_tools)
         if not df.empty:
             all_dfs.append(df)
     else:
         print(f"Error: The path '{path_input}' is not a valid file or directory.")
         return
 
+    # Filters were already applied while loading
+    if exclude_extensions:
+        print(f"Filtered out requests with extensions: {', '.join(exclude_extensions)}")
+    if exclude_tools:
+        print(f"Filtered out requests from tools: {', '.join(exclude_tools)}")
+
     if not all_dfs:
         print("No valid CSV data could be loaded from the specified path.")
         return
     
-    master_df = pd.concat([df.fillna(value=pd.NA) for df in all_dfs], ignore_index=True)
+    master_df = pd.concat(all_dfs, ignore_index=True)
+    del all_dfs
 
-    html_report, analysis_data = analyze_burp_log(master_df, exclude_extensions, exclude_tools)
+    html_report, analysis_data = analyze_burp_log(master_df)
 
     if html_report:
         report_path = "burp_analysis_report.html" # Default value
@@ -358,7 +522,7 @@ def main():
             report_path = output_path_str
 
         with open(report_path, "w", encoding='utf-8') as f:
-            f.write(html_report)
+            f.writelines(html_report)
         print(f"\nHTML report generated: {os.path.abspath(report_path)}")
         try:
             webbrowser.open('file://' + os.path.realpath(report_path))
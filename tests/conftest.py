@@ -0,0 +1,29 @@
+import importlib.util
+import os
+
+import pytest
+
+SCRIPT = os.path.join(os.path.dirname(__file__), '..', 'Analyze-LoggerPlusPlus.py')
+
+
+def _load_script():
+    spec = importlib.util.spec_from_file_location('analyze_loggerplusplus', SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope='session')
+def analyzer():
+    """
+    The Analyze-LoggerPlusPlus.py script, loaded as a module (its file name is not importable).
+    """
+    return _load_script()
+
+
+@pytest.fixture
+def load_analyzer():
+    """
+    Loads a fresh copy of the script, for tests that patch what it checks at import time.
+    """
+    return _load_script
@@ -0,0 +1,46 @@
+from collections import Counter
+
+import pandas as pd
+import pytest
+
+
+def test_tool_endpoint_counts_export_only_observed_pairs(analyzer):
+    df = pd.DataFrame({
+        'Request.URL': ['http://a/x', 'http://a/x', 'http://a/y'],
+        'Request.Tool': ['Proxy', 'Proxy', 'Scanner'],
+        'Request.Time': ['07/22/2025 10:00:00 AM'] * 3,
+    })
+
+    _, analysis_data = analyzer.analyze_burp_log(df)
+
+    assert analysis_data['tool_endpoint_counts'] == {
+        'http://a/x': {'Proxy': 2},
+        'http://a/y': {'Scanner': 1},
+    }
+
+
+def test_count_pairs_skips_missing_values(analyzer):
+    urls = pd.Series(['http://a/x', 'http://a/x', None, 'http://a/y', 'http://a/y', 'http://a/z'], name='Request.URL')
+    tools = pd.Series(['Proxy', None, 'Proxy', 'Scanner', 'Proxy', None], name='Request.Tool')
+    # What the original per-row defaultdict loop counted for rows with both a URL and a tool
+    expected = {}
+    for (url, tool), count in Counter(zip(urls, tools)).items():
+        if pd.notna(url) and pd.notna(tool):
+            expected.setdefault(url, {})[tool] = count
+
+    counts = analyzer.count_pairs(urls.astype('category'), tools.astype('category'))
+
+    assert analyzer.nonzero_pairs(counts) == expected
+    assert expected == {'http://a/x': {'Proxy': 1}, 'http://a/y': {'Scanner': 1, 'Proxy': 1}}
+
+
+@pytest.mark.parametrize('dtype', ['float64', 'double[pyarrow]'])
+def test_header_fallback_without_any_response_headers(analyzer, dtype):
+    df = pd.DataFrame({
+        'Request.URL': ['http://a/x'] * 3,
+        'Request.Tool': ['Proxy'] * 3,
+        'Request.Time': ['not a time'] * 3,
+        'Response.Headers': pd.Series([None] * 3, dtype=dtype),
+    })
+
+    assert analyzer.analyze_burp_log(df) == (None, None)
@@ -0,0 +1,71 @@
+import csv
+import os
+
+import pytest
+
+ROWS = 6000
+
+
+def write_export(analyzer, path, header):
+    """
+    Writes a Logger++-style export larger than 1 MB whose header and body cells span lines.
+    """
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=analyzer.DEFAULT_HEADERS)
+        if header:
+            writer.writeheader()
+        for i in range(ROWS):
+            row = dict.fromkeys(analyzer.DEFAULT_HEADERS, '')
+            row.update({
+                'Entry.Tool': 'Proxy',
+                'Request.URL': f'https://example.com/item/{i}',
+                'Request.Tool': 'Proxy',
+                'Request.Time': '07/22/2025 10:00:00 AM',
+                'Request.Headers': 'GET / HTTP/1.1\r\nHost: example.com\r\n\r\n',
+                'Request.Body': 'a=1\r\nb=2',
+                'Response.Headers': 'HTTP/1.1 200 OK\r\nDate: Tue, 22 Jul 2025 10:00:00 GMT\r\nServer: test\r\n',
+            })
+            writer.writerow(row)
+    assert os.path.getsize(path) > 1024 * 1024
+
+
+@pytest.mark.parametrize('header', [True, False])
+def test_large_export_with_multiline_cells_loads(analyzer, tmp_path, header):
+    path = tmp_path / 'export.csv'
+    write_export(analyzer, path, header)
+
+    df = analyzer.load_csv_safely(str(path))
+
+    assert len(df) == ROWS
+    assert sorted(df.columns) == sorted(analyzer.USED_COLS)
+    assert df['Response.Headers'].iloc[0].startswith('HTTP/1.1 200 OK\r\nDate:')
+
+
+def test_filters_apply_across_chunks(analyzer, tmp_path, monkeypatch):
+    path = tmp_path / 'export.csv'
+    write_export(analyzer, path, header=True)
+    monkeypatch.setitem(analyzer.READ_CSV_OPTIONS, 'chunksize', 1000)
+    chunk_sizes = []
+    original_filter = analyzer.filter_requests
+
+    def recording_filter(df, *args):
+        chunk_sizes.append(len(df))
+        return original_filter(df, *args)
+
+    monkeypatch.setattr(analyzer, 'filter_requests', recording_filter)
+
+    df = analyzer.load_csv_safely(str(path), exclude_extensions=['js'], exclude_tools=['Proxy'])
+
+    assert df.empty
+    assert chunk_sizes == [1000] * (ROWS // 1000)
+
+
+def test_arrow_dtype_backend_needs_pandas_2(load_analyzer, monkeypatch):
+    pd = pytest.importorskip('pandas')
+    pytest.importorskip('pyarrow')
+
+    monkeypatch.setattr(pd, '__version__', '1.5.3')
+    assert 'dtype_backend' not in load_analyzer().READ_CSV_OPTIONS
+
+    monkeypatch.setattr(pd, '__version__', '2.2.0')
+    assert load_analyzer().READ_CSV_OPTIONS['dtype_backend'] == 'pyarrow'